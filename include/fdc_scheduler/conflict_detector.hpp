@@ -75,6 +75,17 @@ public:
      */
     std::vector<Conflict> detect_all(const std::vector<std::shared_ptr<TrainSchedule>>& schedules);
     
+    /**
+     * @brief Run detect_all() on several independent schedule sets in parallel
+     * @param schedule_sets Schedule sets, each checked only against itself
+     * @param max_threads Maximum worker threads (0 = hardware concurrency)
+     * @return One conflict vector per schedule set, in input order
+     * @note Schedules must not be modified while detection is running
+     */
+    std::vector<std::vector<Conflict>> detect_all_batch(
+        const std::vector<std::vector<std::shared_ptr<TrainSchedule>>>& schedule_sets,
+        size_t max_threads = 0);
+    
     /**
      * @brief Detect conflicts for a specific train
      * @param schedule Train schedule to check
@@ -7,6 +7,10 @@
 #include <vector>
 #include <map>
 
+namespace pugi {
+class xml_document;
+}
+
 namespace fdc_scheduler {
 
 /**
@@ -73,6 +77,28 @@ public:
         const RailMLExportOptions& options = RailMLExportOptions()
     );
     
+    /**
+     * @brief Export RailML directly to an open file descriptor
+     * 
+     * Serializes straight from the XML document through a fixed-size
+     * buffer, without materializing the whole output as a string.
+     * The descriptor is not closed.
+     * 
+     * @param fd Writable file descriptor
+     * @param network Railway network to export
+     * @param schedules Train schedules to export
+     * @param version RailML version to use
+     * @param options Export options
+     * @return True if all bytes were written
+     */
+    bool export_to_fd(
+        int fd,
+        const RailwayNetwork& network,
+        const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
+        RailMLExportVersion version,
+        const RailMLExportOptions& options = RailMLExportOptions()
+    );
+    
     /**
      * @brief Get last error message
      * @return Error description if export failed
@@ -93,8 +119,18 @@ private:
     int tracks_exported_ = 0;
     int trains_exported_ = 0;
     
+    // Build the complete document for the requested version
+    void build_document(
+        pugi::xml_document& doc,
+        const RailwayNetwork& network,
+        const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
+        RailMLExportVersion version,
+        const RailMLExportOptions& options
+    );
+    
     // RailML 2.x export
-    std::string export_railml2(
+    void export_railml2(
+        pugi::xml_document& doc,
         const RailwayNetwork& network,
         const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
         const RailMLExportOptions& options
@@ -112,7 +148,8 @@ private:
     );
     
     // RailML 3.x export
-    std::string export_railml3(
+    void export_railml3(
+        pugi::xml_document& doc,
         const RailwayNetwork& network,
         const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
         const RailMLExportOptions& options
@@ -105,6 +105,14 @@ public:
     
     // Node management
     bool add_node(const Node& node);
+    
+    /**
+     * @brief Add several nodes in one call
+     * @param nodes Nodes to add (nodes whose ID already exists are skipped)
+     * @return Number of nodes actually added
+     */
+    size_t add_nodes(const std::vector<Node>& nodes);
+    
     bool remove_node(const std::string& node_id);
     std::shared_ptr<Node> get_node(const std::string& node_id) const;
     std::vector<std::shared_ptr<Node>> get_all_nodes() const;
@@ -136,6 +144,18 @@ public:
     
     // Edge management
     bool add_edge(const Edge& edge);
+    
+    /**
+     * @brief Add several edges in one call
+     * @param edges Edges to add (edges with unknown endpoints or already present are skipped)
+     * @param bidirectional If set, overrides each edge's own bidirectional flag
+     *        (true adds the reverse direction for every edge, false for none);
+     *        if empty, every edge keeps its own flag
+     * @return Number of edges actually added (reverse directions not counted)
+     */
+    size_t add_edges(const std::vector<Edge>& edges,
+                     std::optional<bool> bidirectional = std::nullopt);
+    
     bool remove_edge(const std::string& from_node, const std::string& to_node);
     std::shared_ptr<Edge> get_edge(const std::string& from_node, 
                                      const std::string& to_node) const;
@@ -107,6 +107,7 @@ public:
 
     // Gestione fermate
     void add_stop(const ScheduleStop& stop);
+    void add_stops(const std::vector<ScheduleStop>& stops);  // Aggiunta in blocco (una sola riallocazione)
     void insert_stop(size_t index, const ScheduleStop& stop);
     void remove_stop(size_t index);
     ScheduleStop& get_stop(size_t index);
@@ -14,6 +14,12 @@
 #include <pybind11/stl.h>
 #include <pybind11/chrono.h>
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
+
+#include <cstring>
+#include <iomanip>
+#include <limits>
+#include <sstream>
 
 #include "fdc_scheduler/railway_network.hpp"
 #include "fdc_scheduler/node.hpp"
@@ -29,6 +35,93 @@
 namespace py = pybind11;
 using namespace fdc_scheduler;
 
+namespace {
+
+/**
+ * @brief Fixed-size records for building nodes/edges from NumPy structured arrays
+ *
+ * String fields map to NumPy 'S' (bytes) columns and are read up to the
+ * first NUL byte.
+ */
+struct NodeRecord {
+    char id[16];
+    char name[32];
+    uint8_t type;
+    uint32_t platforms;
+};
+
+struct EdgeRecord {
+    char from_node[16];
+    char to_node[16];
+    double distance;
+    uint8_t track_type;
+    double max_speed;
+};
+
+template <size_t N>
+std::string record_string(const char (&field)[N]) {
+    return std::string(field, strnlen(field, N));
+}
+
+/**
+ * @brief Register record dtypes on first use so importing the module
+ *        does not require NumPy
+ */
+void register_record_dtypes() {
+    static const bool registered = [] {
+        PYBIND11_NUMPY_DTYPE(NodeRecord, id, name, type, platforms);
+        PYBIND11_NUMPY_DTYPE(EdgeRecord, from_node, to_node, distance, track_type, max_speed);
+        return true;
+    }();
+    (void)registered;
+}
+
+/**
+ * @brief Convert a record's enum column, rejecting values outside [0, last]
+ */
+template <typename Enum>
+Enum record_enum(uint8_t value, Enum last, const char* field, py::ssize_t row) {
+    if (value > static_cast<uint8_t>(last)) {
+        throw py::value_error("record " + std::to_string(row) + ": invalid " + field +
+                              " value " + std::to_string(value));
+    }
+    return static_cast<Enum>(value);
+}
+
+template <typename Record>
+py::array_t<Record> as_record_array(const py::array& records) {
+    register_record_dtypes();
+    auto arr = py::array_t<Record, py::array::c_style | py::array::forcecast>::ensure(records);
+    if (!arr || arr.ndim() != 1) {
+        throw py::type_error("expected a 1-D structured array with dtype " +
+                             py::str(py::dtype::of<Record>()).cast<std::string>());
+    }
+    return arr;
+}
+
+/**
+ * @brief Format conflicts as a numbered multi-line report in one buffer
+ *
+ * Same layout as the per-field Python report it replaces: the type is shown
+ * as its Python enum repr ("ConflictType.<NAME>"), severity with two decimals.
+ */
+std::string format_conflict_report(const std::vector<Conflict>& conflicts) {
+    std::ostringstream oss;
+    oss << std::fixed << std::setprecision(2);
+    size_t index = 1;
+    for (const auto& conflict : conflicts) {
+        oss << "\n  Conflict #" << index++ << ":"
+            << "\n    Type: ConflictType." << conflict_type_to_string(conflict.type)
+            << "\n    Trains: " << conflict.train1_id << " vs " << conflict.train2_id
+            << "\n    Location: " << conflict.location
+            << "\n    Severity: " << static_cast<double>(conflict.severity)
+            << "\n    Description: " << conflict.description << "\n";
+    }
+    return oss.str();
+}
+
+} // namespace
+
 PYBIND11_MODULE(pyfdc_scheduler, m) {
     m.doc() = "FDC_Scheduler - Complete Railway Network Scheduling Library";
     
@@ -91,8 +184,11 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
     // Node Class
     //==========================================================================
     
-    py::class_<Node>(m, "Node")
-        .def(py::init<const std::string&, const std::string&, NodeType, int>(),
+    py::class_<Node, std::shared_ptr<Node>>(m, "Node")
+        .def(py::init([](const std::string& id, const std::string& name,
+                         NodeType type, int platforms) {
+                 return Node(id, name, type, 0.0, 0.0, 1, platforms);
+             }),
              py::arg("id"),
              py::arg("name"),
              py::arg("type") = NodeType::STATION,
@@ -104,6 +200,29 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
         .def("get_platforms", &Node::get_platforms, "Get number of platforms")
         .def("set_name", &Node::set_name, "Set node name")
         .def("set_platforms", &Node::set_platforms, "Set number of platforms")
+        .def_static("record_dtype", [] {
+                 register_record_dtypes();
+                 return py::dtype::of<NodeRecord>();
+             },
+             "NumPy dtype accepted by Node.from_records")
+        .def_static("from_records", [](const py::array& records) {
+                 auto view = as_record_array<NodeRecord>(records).unchecked<1>();
+                 std::vector<Node> nodes;
+                 nodes.reserve(view.shape(0));
+                 for (py::ssize_t i = 0; i < view.shape(0); ++i) {
+                     const NodeRecord& r = view(i);
+                     if (r.platforms > static_cast<uint32_t>(std::numeric_limits<int>::max())) {
+                         throw py::value_error("record " + std::to_string(i) +
+                                               ": platforms out of range");
+                     }
+                     nodes.emplace_back(record_string(r.id), record_string(r.name),
+                                        record_enum(r.type, NodeType::YARD, "type", i),
+                                        0.0, 0.0, 1, static_cast<int>(r.platforms));
+                 }
+                 return nodes;
+             },
+             py::arg("records"),
+             "Create nodes from a structured array with Node.record_dtype()")
         .def("__repr__", [](const Node& n) {
             return "<Node id='" + n.get_id() + "' name='" + n.get_name() + "'>";
         });
@@ -112,7 +231,7 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
     // Edge Class
     //==========================================================================
     
-    py::class_<Edge>(m, "Edge")
+    py::class_<Edge, std::shared_ptr<Edge>>(m, "Edge")
         .def(py::init<const std::string&, const std::string&, double, TrackType, double>(),
              py::arg("from_node"),
              py::arg("to_node"),
@@ -127,6 +246,26 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
         .def("get_max_speed", &Edge::get_max_speed, "Get maximum speed in km/h")
         .def("set_distance", &Edge::set_distance, "Set distance")
         .def("set_max_speed", &Edge::set_max_speed, "Set maximum speed")
+        .def_static("record_dtype", [] {
+                 register_record_dtypes();
+                 return py::dtype::of<EdgeRecord>();
+             },
+             "NumPy dtype accepted by Edge.from_records")
+        .def_static("from_records", [](const py::array& records) {
+                 auto view = as_record_array<EdgeRecord>(records).unchecked<1>();
+                 std::vector<Edge> edges;
+                 edges.reserve(view.shape(0));
+                 for (py::ssize_t i = 0; i < view.shape(0); ++i) {
+                     const EdgeRecord& r = view(i);
+                     edges.emplace_back(record_string(r.from_node), record_string(r.to_node),
+                                        r.distance,
+                                        record_enum(r.track_type, TrackType::FREIGHT, "track_type", i),
+                                        r.max_speed);
+                 }
+                 return edges;
+             },
+             py::arg("records"),
+             "Create edges from a structured array with Edge.record_dtype()")
         .def("__repr__", [](const Edge& e) {
             return "<Edge " + e.get_from_node() + " -> " + e.get_to_node() + 
                    " (" + std::to_string(e.get_distance()) + " km)>";
@@ -176,6 +315,21 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
              py::arg("departure"),
              py::arg("is_stop") = true,
              "Create a schedule stop at a station")
+        .def(py::init([](const std::string& node_id,
+                         int64_t arrival_s,
+                         int64_t departure_s,
+                         bool is_stop) {
+                 using std::chrono::system_clock;
+                 return ScheduleStop(node_id,
+                                     system_clock::time_point(std::chrono::seconds(arrival_s)),
+                                     system_clock::time_point(std::chrono::seconds(departure_s)),
+                                     is_stop);
+             }),
+             py::arg("node_id"),
+             py::arg("arrival"),
+             py::arg("departure"),
+             py::arg("is_stop") = true,
+             "Create a schedule stop from Unix epoch seconds")
         .def_readwrite("node_id", &ScheduleStop::node_id, "Station ID")
         .def_readwrite("arrival", &ScheduleStop::arrival, "Arrival time")
         .def_readwrite("departure", &ScheduleStop::departure, "Departure time")
@@ -202,7 +356,23 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
         .def("add_stop", &TrainSchedule::add_stop, 
              py::arg("stop"),
              "Add a stop to the schedule")
-        .def("get_stops", 
+        .def("add_stops",
+             [](TrainSchedule& self,
+                const std::vector<std::tuple<std::string, int64_t, int64_t, bool>>& records) {
+                 using std::chrono::system_clock;
+                 std::vector<ScheduleStop> stops;
+                 stops.reserve(records.size());
+                 for (const auto& [node_id, arrival_s, departure_s, is_stop] : records) {
+                     stops.emplace_back(node_id,
+                                        system_clock::time_point(std::chrono::seconds(arrival_s)),
+                                        system_clock::time_point(std::chrono::seconds(departure_s)),
+                                        is_stop);
+                 }
+                 self.add_stops(stops);
+             },
+             py::arg("stops"),
+             "Add several stops at once from (node_id, arrival_epoch_s, departure_epoch_s, is_stop) tuples")
+        .def("get_stops",
              py::overload_cast<>(&TrainSchedule::get_stops, py::const_),
              py::return_value_policy::reference_internal,
              "Get list of all stops")
@@ -221,9 +391,17 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
         .def("add_node", &RailwayNetwork::add_node,
              py::arg("node"),
              "Add a node (station/junction) to the network")
+        .def("add_nodes", &RailwayNetwork::add_nodes,
+             py::arg("nodes"),
+             "Add several nodes in one call, returns the number added")
         .def("add_edge", &RailwayNetwork::add_edge,
              py::arg("edge"),
              "Add an edge (track section) to the network")
+        .def("add_edges", &RailwayNetwork::add_edges,
+             py::arg("edges"),
+             py::arg("bidirectional") = py::none(),
+             "Add several edges in one call, returns the number added "
+             "(bidirectional=None keeps each edge's own flag)")
         .def("has_node", &RailwayNetwork::has_node,
              py::arg("node_id"),
              "Check if node exists")
@@ -239,11 +417,16 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
              "Get number of nodes")
         .def("num_edges", &RailwayNetwork::num_edges,
              "Get number of edges")
-        .def("find_shortest_path", &RailwayNetwork::find_shortest_path,
+        .def("find_shortest_path",
+             [](const RailwayNetwork& self, const std::string& start_node,
+                const std::string& end_node, bool use_distance) {
+                 return self.find_shortest_path(start_node, end_node, use_distance).nodes;
+             },
              py::arg("start_node"),
              py::arg("end_node"),
              py::arg("use_distance") = true,
-             "Find shortest path between two nodes")
+             py::call_guard<py::gil_scoped_release>(),
+             "Find shortest path between two nodes (node IDs, empty if unreachable)")
         .def("__repr__", [](const RailwayNetwork& n) {
             return "<RailwayNetwork nodes=" + std::to_string(n.num_nodes()) + 
                    " edges=" + std::to_string(n.num_edges()) + ">";
@@ -276,7 +459,16 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
              "Create conflict detector for a network")
         .def("detect_all", &ConflictDetector::detect_all,
              py::arg("schedules"),
+             py::call_guard<py::gil_scoped_release>(),
              "Detect all conflicts in the given schedules")
+        .def("detect_all_batch", &ConflictDetector::detect_all_batch,
+             py::arg("schedule_sets"),
+             py::arg("max_threads") = 0,
+             py::call_guard<py::gil_scoped_release>(),
+             "Detect conflicts in several independent schedule sets in parallel")
+        .def_static("format_report", &format_conflict_report,
+                    py::arg("conflicts"),
+                    "Format conflicts as a numbered multi-line report")
         .def("__repr__", [](const ConflictDetector&) {
             return "<ConflictDetector>";
         });
@@ -335,10 +527,14 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
              },
              py::arg("schedules"),
              py::arg("conflicts"),
+             py::call_guard<py::gil_scoped_release>(),
              "Resolve conflicts using AI strategies")
         .def("get_config", &RailwayAIResolver::get_config,
              py::return_value_policy::reference_internal,
              "Get current configuration")
+        .def("set_config", &RailwayAIResolver::set_config,
+             py::arg("config"),
+             "Replace the configuration, keeping the resolver bound to its network")
         .def("__repr__", [](const RailwayAIResolver&) {
             return "<RailwayAIResolver>";
         });
@@ -414,6 +610,22 @@ PYBIND11_MODULE(pyfdc_scheduler, m) {
              py::arg("version"),
              py::arg("options") = RailMLExportOptions(),
              "Export to RailML string")
+        .def("export_to_fd",
+             [](RailMLExporter& self,
+                int fd,
+                const RailwayNetwork& network,
+                const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
+                RailMLExportVersion version,
+                const RailMLExportOptions& options) {
+                 return self.export_to_fd(fd, network, schedules, version, options);
+             },
+             py::arg("fd"),
+             py::arg("network"),
+             py::arg("schedules"),
+             py::arg("version"),
+             py::arg("options") = RailMLExportOptions(),
+             py::call_guard<py::gil_scoped_release>(),
+             "Stream RailML to an open file descriptor (e.g. f.fileno()) without building a string")
         .def("get_last_error", &RailMLExporter::get_last_error,
              "Get last error message")
         .def("get_statistics", &RailMLExporter::get_statistics,
@@ -0,0 +1,27 @@
+"""
+pytest configuration for FDC_Scheduler Python bindings
+Puts the built module on sys.path and provides a session-wide test network,
+so the extension is imported and the network built once per test run.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../build/python'))
+
+import pytest
+import pyfdc_scheduler as fdc
+
+@pytest.fixture(scope="session")
+def network():
+    """Milano - Firenze - Roma high-speed line (read-only: do not modify in tests)"""
+    network = fdc.RailwayNetwork()
+    network.add_nodes([
+        fdc.Node("MILANO", "Milano Centrale", fdc.NodeType.STATION),
+        fdc.Node("ROMA", "Roma Termini", fdc.NodeType.STATION),
+        fdc.Node("FIRENZE", "Firenze SMN", fdc.NodeType.STATION),
+    ])
+    network.add_edges([
+        fdc.Edge("MILANO", "FIRENZE", 280.0, fdc.TrackType.HIGH_SPEED, 300.0),
+        fdc.Edge("FIRENZE", "ROMA", 270.0, fdc.TrackType.HIGH_SPEED, 300.0),
+    ])
+    yield network
@@ -5,7 +5,9 @@ Demonstrates the use of Python bindings for railway network management
 """
 
 import sys
-import datetime
+import threading
+import time
+import weakref
 from pathlib import Path
 
 # Add build directory to path
@@ -19,10 +21,47 @@ except ImportError as e:
     print("Make sure to build with -DFDC_SCHEDULER_BUILD_PYTHON=ON")
     sys.exit(1)
 
+# Station IDs, shared by network construction, timetables and queries
+MILANO, BOLOGNA, FIRENZE, ROMA = "Milano", "Bologna", "Firenze", "Roma"
+
+# (id, name, type, platforms)
+_STATIONS = (
+    (MILANO, "Milano Centrale", fdc.NodeType.STATION, 24),
+    (BOLOGNA, "Bologna Centrale", fdc.NodeType.STATION, 16),
+    (FIRENZE, "Firenze SMN", fdc.NodeType.STATION, 18),
+    (ROMA, "Roma Termini", fdc.NodeType.STATION, 32),
+)
+
+# (from, to, distance_km, track_type, max_speed_kmh); reverse directions are
+# created by the network
+_TRACKS = (
+    (MILANO, BOLOGNA, 219.0, fdc.TrackType.HIGH_SPEED, 300.0),
+    (BOLOGNA, FIRENZE, 105.0, fdc.TrackType.HIGH_SPEED, 300.0),
+    (FIRENZE, ROMA, 277.0, fdc.TrackType.HIGH_SPEED, 300.0),
+)
+
+# Section separator lines
+_SEP = "=" * 60
+_NL_SEP = "\n" + _SEP
+_SEP_NL = _SEP + "\n"
+
+# One resolver per network and thread, reused across runs (only its config
+# changes). Per thread because resolve_conflicts releases the GIL and
+# set_config must not race with a resolution in progress.
+_local = threading.local()
+
+def get_resolver(network):
+    """Return this thread's cached RailwayAIResolver for a network, creating it on first use"""
+    resolvers = getattr(_local, "resolvers", None)
+    if resolvers is None:
+        resolvers = _local.resolvers = weakref.WeakKeyDictionary()
+    resolver = resolvers.get(network)
+    if resolver is None:
+        resolver = resolvers[network] = fdc.RailwayAIResolver(network)
+    return resolver
+
 def print_separator(title):
-    print("\n" + "=" * 60)
-    print(f"  {title}")
-    print("=" * 60 + "\n")
+    sys.stdout.write(f"{_NL_SEP}\n  {title}\n{_SEP_NL}\n")
 
 def create_test_network():
     """Create a simple railway network for testing"""
@@ -31,26 +70,16 @@ def create_test_network():
     network = fdc.RailwayNetwork()
     
     # Add stations
-    network.add_node(fdc.Node("Milano", "Milano Centrale", fdc.NodeType.STATION, 24))
-    network.add_node(fdc.Node("Bologna", "Bologna Centrale", fdc.NodeType.STATION, 16))
-    network.add_node(fdc.Node("Firenze", "Firenze SMN", fdc.NodeType.STATION, 18))
-    network.add_node(fdc.Node("Roma", "Roma Termini", fdc.NodeType.STATION, 32))
+    network.add_nodes([fdc.Node(*station) for station in _STATIONS])
     
-    print(f"Added {network.get_node_count()} stations:")
+    print(f"Added {network.num_nodes()} stations:")
     for node in network.get_all_nodes():
         print(f"  - {node}")
     
     # Add tracks
-    network.add_edge(fdc.Edge("Milano", "Bologna", 219.0, fdc.TrackType.HIGH_SPEED, 300.0))
-    network.add_edge(fdc.Edge("Bologna", "Firenze", 105.0, fdc.TrackType.HIGH_SPEED, 300.0))
-    network.add_edge(fdc.Edge("Firenze", "Roma", 277.0, fdc.TrackType.HIGH_SPEED, 300.0))
+    network.add_edges([fdc.Edge(*track) for track in _TRACKS], bidirectional=True)
     
-    # Reverse directions
-    network.add_edge(fdc.Edge("Bologna", "Milano", 219.0, fdc.TrackType.HIGH_SPEED, 300.0))
-    network.add_edge(fdc.Edge("Firenze", "Bologna", 105.0, fdc.TrackType.HIGH_SPEED, 300.0))
-    network.add_edge(fdc.Edge("Roma", "Firenze", 277.0, fdc.TrackType.HIGH_SPEED, 300.0))
-    
-    print(f"\nAdded {network.get_edge_count()} track sections")
+    print(f"\nAdded {network.num_edges()} track sections")
     
     return network
 
@@ -59,82 +88,25 @@ def create_train_schedules():
     print_separator("Creating Train Schedules")
     
     schedules = []
-    base_time = datetime.datetime.now().replace(hour=6, minute=0, second=0, microsecond=0)
-    
-    # Train 1: Milano -> Roma (morning)
-    train1 = fdc.TrainSchedule("FR_9600")
-    train1.add_stop(fdc.ScheduleStop(
-        "Milano",
-        base_time,
-        base_time + datetime.timedelta(minutes=5),
-        True
-    ))
-    train1.add_stop(fdc.ScheduleStop(
-        "Bologna",
-        base_time + datetime.timedelta(minutes=50),
-        base_time + datetime.timedelta(minutes=53),
-        True
-    ))
-    train1.add_stop(fdc.ScheduleStop(
-        "Firenze",
-        base_time + datetime.timedelta(minutes=110),
-        base_time + datetime.timedelta(minutes=113),
-        True
-    ))
-    train1.add_stop(fdc.ScheduleStop(
-        "Roma",
-        base_time + datetime.timedelta(minutes=190),
-        base_time + datetime.timedelta(minutes=200),
-        True
-    ))
-    schedules.append(train1)
-    print(f"  {train1}")
-    
-    # Train 2: Milano -> Roma (slightly later, potential conflict)
-    train2 = fdc.TrainSchedule("FR_9602")
-    train2.add_stop(fdc.ScheduleStop(
-        "Milano",
-        base_time + datetime.timedelta(minutes=10),
-        base_time + datetime.timedelta(minutes=15),
-        True
-    ))
-    train2.add_stop(fdc.ScheduleStop(
-        "Bologna",
-        base_time + datetime.timedelta(minutes=55),
-        base_time + datetime.timedelta(minutes=58),
-        True
-    ))
-    train2.add_stop(fdc.ScheduleStop(
-        "Roma",
-        base_time + datetime.timedelta(minutes=195),
-        base_time + datetime.timedelta(minutes=205),
-        True
-    ))
-    schedules.append(train2)
-    print(f"  {train2}")
-    
-    # Train 3: Roma -> Milano (return service)
-    train3 = fdc.TrainSchedule("FR_9605")
-    train3.add_stop(fdc.ScheduleStop(
-        "Roma",
-        base_time + datetime.timedelta(hours=1),
-        base_time + datetime.timedelta(hours=1, minutes=5),
-        True
-    ))
-    train3.add_stop(fdc.ScheduleStop(
-        "Firenze",
-        base_time + datetime.timedelta(hours=2, minutes=25),
-        base_time + datetime.timedelta(hours=2, minutes=28),
-        True
-    ))
-    train3.add_stop(fdc.ScheduleStop(
-        "Milano",
-        base_time + datetime.timedelta(hours=3, minutes=15),
-        base_time + datetime.timedelta(hours=3, minutes=20),
-        True
-    ))
-    schedules.append(train3)
-    print(f"  {train3}")
+    today = time.localtime()
+    base = int(time.mktime((today.tm_year, today.tm_mon, today.tm_mday, 6, 0, 0, 0, 0, -1)))
+    
+    # (train_id, [(station, arrival_min, departure_min), ...]) relative to 06:00
+    timetable = [
+        # Train 1: Milano -> Roma (morning)
+        ("FR_9600", [(MILANO, 0, 5), (BOLOGNA, 50, 53), (FIRENZE, 110, 113), (ROMA, 190, 200)]),
+        # Train 2: Milano -> Roma (slightly later, potential conflict)
+        ("FR_9602", [(MILANO, 10, 15), (BOLOGNA, 55, 58), (ROMA, 195, 205)]),
+        # Train 3: Roma -> Milano (return service)
+        ("FR_9605", [(ROMA, 60, 65), (FIRENZE, 145, 148), (MILANO, 195, 200)]),
+    ]
+    
+    for train_id, stops in timetable:
+        train = fdc.TrainSchedule(train_id)
+        train.add_stops([(station, base + arr * 60, base + dep * 60, True)
+                         for station, arr, dep in stops])
+        schedules.append(train)
+        print(f"  {train}")
     
     return schedules
 
@@ -143,18 +115,11 @@ def detect_conflicts(network, schedules):
     print_separator("Detecting Conflicts")
     
     detector = fdc.ConflictDetector(network)
-    detector.set_buffer_time(120)  # 2 minutes buffer
     
-    conflicts = detector.detect_conflicts(schedules)
+    conflicts = detector.detect_all(schedules)
     
     print(f"Found {len(conflicts)} conflict(s):")
-    for i, conflict in enumerate(conflicts, 1):
-        print(f"\n  Conflict #{i}:")
-        print(f"    Type: {conflict.type}")
-        print(f"    Trains: {conflict.train1_id} vs {conflict.train2_id}")
-        print(f"    Location: {conflict.location}")
-        print(f"    Severity: {conflict.severity:.2f}")
-        print(f"    Description: {conflict.description}")
+    sys.stdout.write(fdc.ConflictDetector.format_report(conflicts))
     
     return conflicts
 
@@ -168,14 +133,15 @@ def resolve_conflicts_with_ai(network, conflicts, schedules):
     
     # Configure AI resolver
     config = fdc.RailwayAIConfig()
-    config.enable_delay = True
-    config.enable_platform_change = True
+    config.allow_platform_reassignment = True
     config.max_delay_minutes = 10
     config.min_headway_seconds = 120
     
-    resolver = fdc.RailwayAIResolver(network, config)
+    resolver = get_resolver(network)
+    resolver.set_config(config)
     
-    result = resolver.resolve_conflicts(conflicts, schedules)
+    # Schedules are adjusted in place
+    result = resolver.resolve_conflicts(schedules=schedules, conflicts=conflicts)
     
     print(f"Resolution result:")
     print(f"  Success: {result.success}")
@@ -183,12 +149,11 @@ def resolve_conflicts_with_ai(network, conflicts, schedules):
     print(f"  Quality score: {result.quality_score:.2f}")
     print(f"  Modified trains: {len(result.modified_trains)}")
     
-    if result.resolution_notes:
+    if result.description:
         print(f"\n  Notes:")
-        for note in result.resolution_notes:
-            print(f"    - {note}")
+        print(f"    - {result.description}")
     
-    return result.modified_trains if result.success else schedules
+    return schedules
 
 def export_to_railml(network, schedules):
     """Export network and schedules to RailML"""
@@ -203,13 +168,14 @@ def export_to_railml(network, schedules):
     options.export_timetable = True
     
     filename = "python_example_network.railml"
-    success = exporter.export_to_file(
-        filename,
-        network,
-        schedules,
-        fdc.RailMLExportVersion.VERSION_3,
-        options
-    )
+    with open(filename, "wb") as f:
+        success = exporter.export_to_fd(
+            f.fileno(),
+            network,
+            schedules,
+            fdc.RailMLExportVersion.VERSION_3,
+            options
+        )
     
     if success:
         stats = exporter.get_statistics()
@@ -224,7 +190,7 @@ def find_shortest_path(network):
     """Demonstrate pathfinding"""
     print_separator("Pathfinding")
     
-    path = network.find_shortest_path("Milano", "Roma")
+    path = network.find_shortest_path(MILANO, ROMA)
     
     if path:
         print(f"Shortest path from Milano to Roma:")
@@ -235,10 +201,10 @@ def find_shortest_path(network):
 
 def main():
     """Main example function"""
-    print("\n" + "=" * 60)
+    print(_NL_SEP)
     print("  FDC_Scheduler Python Bindings Example")
     print("  High-Speed Rail Network: Milano - Bologna - Firenze - Roma")
-    print("=" * 60)
+    print(_SEP)
     
     try:
         # Create network
@@ -262,7 +228,7 @@ def main():
         
         print_separator("Summary")
         print("✓ Python bindings working correctly!")
-        print(f"✓ Network: {network.get_node_count()} stations, {network.get_edge_count()} tracks")
+        print(f"✓ Network: {network.num_nodes()} stations, {network.num_edges()} tracks")
         print(f"✓ Schedules: {len(schedules)} trains")
         print(f"✓ Conflicts detected and resolved")
         print(f"✓ RailML export successful")
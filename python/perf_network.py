@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Network construction stress test for FDC_Scheduler Python bindings
+Builds a large synthetic network from NumPy arrays through the bulk APIs
+(Node/Edge.from_records + add_nodes/add_edges) and checks the result.
+
+Usage:
+    python perf_network.py [num_nodes]
+
+Numba is used to generate the topology when available; without it the same
+code runs as plain Python.
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../build/python'))
+
+import numpy as np
+import pyfdc_scheduler as fdc
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: run undecorated"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+DEFAULT_NUM_NODES = 10000
+MIN_NUM_NODES = 3  # Smallest network with a skip edge (N0 -> N2)
+
+@njit(cache=True)
+def _build_topology(n, seed):
+    """Chain 0-1-...-(n-1) plus a skip edge i -> i+2 for every even i.
+
+    Returns (src, dst, distance_km) arrays.
+    """
+    np.random.seed(seed)
+    num_skip = (n - 1) // 2
+    m = (n - 1) + num_skip
+    src = np.empty(m, dtype=np.int64)
+    dst = np.empty(m, dtype=np.int64)
+    dist = np.empty(m, dtype=np.float64)
+
+    k = 0
+    for i in range(n - 1):
+        src[k] = i
+        dst[k] = i + 1
+        dist[k] = 5.0 + 45.0 * np.random.random()
+        k += 1
+    for i in range(0, n - 2, 2):
+        src[k] = i
+        dst[k] = i + 2
+        dist[k] = 10.0 + 90.0 * np.random.random()
+        k += 1
+    return src[:k], dst[:k], dist[:k]
+
+def build_network(n, seed=42):
+    """Build an n-node network (n >= MIN_NUM_NODES) and return (network, timings)"""
+    if n < MIN_NUM_NODES:
+        raise ValueError(f"num_nodes must be at least {MIN_NUM_NODES}, got {n}")
+    timings = {}
+
+    t0 = time.perf_counter()
+    ids = np.char.add(b"N", np.arange(n).astype("S15"))
+    src, dst, dist = _build_topology(n, seed)
+    timings["generate"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    node_records = np.zeros(n, dtype=fdc.Node.record_dtype())
+    node_records["id"] = ids
+    node_records["name"] = ids
+    node_records["type"] = int(fdc.NodeType.STATION)
+    node_records["platforms"] = 2
+
+    edge_records = np.zeros(len(src), dtype=fdc.Edge.record_dtype())
+    edge_records["from_node"] = ids[src]
+    edge_records["to_node"] = ids[dst]
+    edge_records["distance"] = dist
+    edge_records["track_type"] = int(fdc.TrackType.DOUBLE)
+    edge_records["max_speed"] = 160.0
+    timings["records"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    network = fdc.RailwayNetwork()
+    nodes_added = network.add_nodes(fdc.Node.from_records(node_records))
+    edges_added = network.add_edges(fdc.Edge.from_records(edge_records), bidirectional=True)
+    timings["insert"] = time.perf_counter() - t0
+
+    assert nodes_added == n
+    assert edges_added == len(src)
+    assert network.num_nodes() == n
+    assert network.num_edges() == 2 * len(src)  # Bidirectional
+    assert network.has_edge("N0", "N2")
+
+    return network, timings
+
+def main():
+    try:
+        n = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_NODES
+    except ValueError:
+        n = 0
+    if n < MIN_NUM_NODES:
+        print(f"Usage: {sys.argv[0]} [num_nodes]  (num_nodes >= {MIN_NUM_NODES})",
+              file=sys.stderr)
+        return 2
+
+    print("=" * 60)
+    print(f"FDC_Scheduler Python Bindings - Network Stress Test ({n} nodes)")
+    print("=" * 60)
+
+    network, timings = build_network(n)
+
+    print(f"\n  {network}")
+    for phase, seconds in timings.items():
+        print(f"  {phase:<10} {seconds * 1000:8.1f} ms")
+    print("\n✓ Network stress test passed")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,191 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test script for FDC_Scheduler Python bindings
-Tests all major functionality to ensure the bindings work correctly.
-"""
-
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../build/python'))
-
-import pyfdc_scheduler as fdc
-
-def test_enums():
-    """Test all enum types"""
-    print("Testing enums...")
-    
-    # NodeType
-    assert hasattr(fdc, 'NodeType')
-    assert hasattr(fdc.NodeType, 'STATION')
-    assert hasattr(fdc.NodeType, 'JUNCTION')
-    assert hasattr(fdc.NodeType, 'DEPOT')
-    
-    # TrackType
-    assert hasattr(fdc, 'TrackType')
-    assert hasattr(fdc.TrackType, 'SINGLE')
-    assert hasattr(fdc.TrackType, 'DOUBLE')
-    assert hasattr(fdc.TrackType, 'HIGH_SPEED')
-    
-    # TrainType
-    assert hasattr(fdc, 'TrainType')
-    assert hasattr(fdc.TrainType, 'REGIONAL')
-    assert hasattr(fdc.TrainType, 'INTERCITY')
-    assert hasattr(fdc.TrainType, 'HIGH_SPEED')
-    
-    # ConflictType
-    assert hasattr(fdc, 'ConflictType')
-    assert hasattr(fdc.ConflictType, 'SECTION_OVERLAP')
-    assert hasattr(fdc.ConflictType, 'PLATFORM_CONFLICT')
-    
-    print("✓ All enum tests passed")
-
-def test_network():
-    """Test railway network creation and management"""
-    print("\nTesting network operations...")
-    
-    # Create network
-    network = fdc.RailwayNetwork()
-    assert network.num_nodes() == 0
-    assert network.num_edges() == 0
-    
-    # Add nodes
-    milano = fdc.Node("MILANO", "Milano Centrale", fdc.NodeType.STATION)
-    roma = fdc.Node("ROMA", "Roma Termini", fdc.NodeType.STATION)
-    firenze = fdc.Node("FIRENZE", "Firenze SMN", fdc.NodeType.STATION)
-    
-    assert network.add_node(milano)
-    assert network.add_node(roma)
-    assert network.add_node(firenze)
-    assert network.num_nodes() == 3
-    
-    # Add edges
-    edge1 = fdc.Edge("MILANO", "FIRENZE", 280.0, fdc.TrackType.HIGH_SPEED)
-    edge2 = fdc.Edge("FIRENZE", "ROMA", 270.0, fdc.TrackType.HIGH_SPEED)
-    
-    assert network.add_edge(edge1)
-    assert network.add_edge(edge2)
-    # Note: network creates bidirectional edges automatically
-    assert network.num_edges() == 4  # 2 edges x 2 directions
-    
-    # Check connectivity
-    assert network.has_node("MILANO")
-    assert network.has_node("ROMA")
-    assert network.has_edge("MILANO", "FIRENZE")
-    
-    # Get all nodes/edges
-    nodes = network.get_all_nodes()
-    edges = network.get_all_edges()
-    assert len(nodes) == 3
-    assert len(edges) == 4  # Bidirectional
-    
-    print("✓ Network tests passed")
-    return network
-
-def test_train():
-    """Test train creation and properties"""
-    print("\nTesting train operations...")
-    
-    # Create trains
-    train1 = fdc.Train("IC100", "InterCity 100", fdc.TrainType.INTERCITY, 200.0)
-    assert train1.get_id() == "IC100"
-    assert train1.get_name() == "InterCity 100"
-    assert train1.get_max_speed() == 200.0
-    
-    train2 = fdc.Train("FR1000", "Frecciarossa", fdc.TrainType.HIGH_SPEED, 300.0, 0.8, 1.0)
-    assert train2.get_max_speed() == 300.0
-    assert train2.get_acceleration() == 0.8
-    assert train2.get_deceleration() == 1.0
-    
-    # Test travel time calculation (returns time in hours)
-    try:
-        travel_time = train2.calculate_travel_time(100.0, 250.0)
-        assert travel_time > 0
-        print(f"  Travel time for 100km @ 250km/h: {travel_time:.2f} hours")
-    except Exception as e:
-        print(f"  Note: calculate_travel_time test skipped ({e})")
-    
-    print("✓ Train tests passed")
-    return train1, train2
-
-def test_conflict_detection(network):
-    """Test conflict detection"""
-    print("\nTesting conflict detection...")
-    
-    # Create detector
-    detector = fdc.ConflictDetector(network)
-    print(f"✓ ConflictDetector created: {detector}")
-    
-    # Note: Full conflict detection requires schedules
-    # which need more complex setup with time points
-    
-    print("✓ Conflict detection tests passed")
-    return detector
-
-def test_ai_resolver(network):
-    """Test AI-based conflict resolution"""
-    print("\nTesting AI resolver...")
-    
-    # Create default config
-    config = fdc.RailwayAIConfig()
-    assert config.max_delay_minutes == 30
-    assert config.min_headway_seconds == 120
-    
-    # Modify config
-    config.delay_weight = 1.5
-    config.platform_change_weight = 0.3
-    assert config.delay_weight == 1.5
-    
-    # Create resolver
-    resolver = fdc.RailwayAIResolver(network, config)
-    print(f"✓ RailwayAIResolver created with custom config")
-    
-    print("✓ AI resolver tests passed")
-    return resolver
-
-def test_railml():
-    """Test RailML import/export functionality"""
-    print("\nTesting RailML support...")
-    
-    # Test version enum
-    assert hasattr(fdc, 'RailMLVersion')
-    assert hasattr(fdc.RailMLVersion, 'VERSION_2')
-    assert hasattr(fdc.RailMLVersion, 'VERSION_3')
-    
-    # Test export options
-    options = fdc.RailMLExportOptions()
-    assert hasattr(options, 'version')
-    assert hasattr(options, 'pretty_print')
-    
-    print("✓ RailML tests passed")
-
-def main():
-    """Run all tests"""
-    print("=" * 60)
-    print("FDC_Scheduler Python Bindings - Comprehensive Test Suite")
-    print("=" * 60)
-    
-    try:
-        # Run all tests
-        test_enums()
-        network = test_network()
-        train1, train2 = test_train()
-        detector = test_conflict_detection(network)
-        resolver = test_ai_resolver(network)
-        test_railml()
-        
-        print("\n" + "=" * 60)
-        print("✓✓✓ ALL TESTS PASSED SUCCESSFULLY! ✓✓✓")
-        print("=" * 60)
-        print(f"\nPython bindings version: {fdc.__version__}")
-        print(f"Available classes: {len([x for x in dir(fdc) if not x.startswith('_')])}")
-        
-        return 0
-        
-    except Exception as e:
-        print(f"\n✗ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-if __name__ == "__main__":
-    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Test suite for FDC_Scheduler Python bindings
+Tests all major functionality to ensure the bindings work correctly.
+
+Run with:
+    pytest python/
+"""
+
+import pytest
+import pyfdc_scheduler as fdc
+
+# Station IDs of the shared `network` fixture (see conftest.py)
+MILANO, ROMA, FIRENZE = "MILANO", "ROMA", "FIRENZE"
+
+def make_schedule(train_id, start):
+    """MILANO -> FIRENZE schedule departing at `start` (epoch seconds)"""
+    schedule = fdc.TrainSchedule(train_id)
+    schedule.add_stops([
+        (MILANO, start, start + 120, True),
+        (FIRENZE, start + 5400, start + 5520, True),
+    ])
+    return schedule
+
+def test_version():
+    """Test module metadata"""
+    assert fdc.__version__ == "2.0.0"
+
+def test_enums():
+    """Test all enum types"""
+    # NodeType
+    assert hasattr(fdc, 'NodeType')
+    assert hasattr(fdc.NodeType, 'STATION')
+    assert hasattr(fdc.NodeType, 'JUNCTION')
+    assert hasattr(fdc.NodeType, 'DEPOT')
+
+    # TrackType
+    assert hasattr(fdc, 'TrackType')
+    assert hasattr(fdc.TrackType, 'SINGLE')
+    assert hasattr(fdc.TrackType, 'DOUBLE')
+    assert hasattr(fdc.TrackType, 'HIGH_SPEED')
+
+    # TrainType
+    assert hasattr(fdc, 'TrainType')
+    assert hasattr(fdc.TrainType, 'REGIONAL')
+    assert hasattr(fdc.TrainType, 'INTERCITY')
+    assert hasattr(fdc.TrainType, 'HIGH_SPEED')
+
+    # ConflictType
+    assert hasattr(fdc, 'ConflictType')
+    assert hasattr(fdc.ConflictType, 'SECTION_OVERLAP')
+    assert hasattr(fdc.ConflictType, 'PLATFORM_CONFLICT')
+
+def test_network_construction():
+    """Test railway network creation and management"""
+    # Create network
+    network = fdc.RailwayNetwork()
+    assert network.num_nodes() == 0
+    assert network.num_edges() == 0
+
+    # Add nodes
+    milano = fdc.Node(MILANO, "Milano Centrale", fdc.NodeType.STATION, 24)
+    assert milano.get_platforms() == 24
+    roma = fdc.Node(ROMA, "Roma Termini", fdc.NodeType.STATION)
+    firenze = fdc.Node(FIRENZE, "Firenze SMN", fdc.NodeType.STATION)
+
+    assert network.add_node(milano)
+    assert network.add_node(roma)
+    assert network.add_node(firenze)
+    assert network.num_nodes() == 3
+
+    # Add edges
+    edge1 = fdc.Edge(MILANO, FIRENZE, 280.0, fdc.TrackType.HIGH_SPEED)
+    edge2 = fdc.Edge(FIRENZE, ROMA, 270.0, fdc.TrackType.HIGH_SPEED)
+
+    assert network.add_edge(edge1)
+    assert network.add_edge(edge2)
+    # Note: network creates bidirectional edges automatically
+    assert network.num_edges() == 4  # 2 edges x 2 directions
+
+def test_network_queries(network):
+    """Test connectivity queries on the shared network"""
+    assert network.has_node(MILANO)
+    assert network.has_node(ROMA)
+    assert network.has_edge(MILANO, FIRENZE)
+    assert network.has_edge(ROMA, FIRENZE)  # Reverse direction
+
+    # Get all nodes/edges
+    nodes = network.get_all_nodes()
+    edges = network.get_all_edges()
+    assert len(nodes) == 3
+    assert len(edges) == 4  # Bidirectional
+
+    # Shortest path as a list of node IDs
+    assert network.find_shortest_path(MILANO, ROMA) == [MILANO, FIRENZE, ROMA]
+
+def test_records():
+    """Test bulk node/edge construction from NumPy structured arrays"""
+    np = pytest.importorskip("numpy")
+
+    node_records = np.array([
+        (b"MILANO", b"Milano Centrale", int(fdc.NodeType.STATION), 24),
+        (b"ROMA", b"Roma Termini", int(fdc.NodeType.STATION), 32),
+    ], dtype=fdc.Node.record_dtype())
+    edge_records = np.array([
+        (b"MILANO", b"ROMA", 480.0, int(fdc.TrackType.HIGH_SPEED), 300.0),
+    ], dtype=fdc.Edge.record_dtype())
+
+    nodes = fdc.Node.from_records(node_records)
+    edges = fdc.Edge.from_records(edge_records)
+    assert [n.get_id() for n in nodes] == [MILANO, ROMA]
+    assert nodes[1].get_platforms() == 32
+    assert edges[0].get_max_speed() == 300.0
+
+    network = fdc.RailwayNetwork()
+    assert network.add_nodes(nodes) == 2
+    assert network.add_edges(edges) == 1
+    assert network.has_edge(ROMA, MILANO)
+
+    # Out-of-range enum and platform values are rejected
+    bad_nodes = node_records.copy()
+    bad_nodes["type"][1] = 200
+    with pytest.raises(ValueError, match="record 1: invalid type"):
+        fdc.Node.from_records(bad_nodes)
+    bad_nodes = node_records.copy()
+    bad_nodes["platforms"][0] = 2**32 - 1
+    with pytest.raises(ValueError, match="platforms out of range"):
+        fdc.Node.from_records(bad_nodes)
+    bad_edges = edge_records.copy()
+    bad_edges["track_type"][0] = len(fdc.TrackType.__members__)
+    with pytest.raises(ValueError, match="invalid track_type"):
+        fdc.Edge.from_records(bad_edges)
+
+def test_train():
+    """Test train creation and properties"""
+    train1 = fdc.Train("IC100", "InterCity 100", fdc.TrainType.INTERCITY, 200.0)
+    assert train1.get_id() == "IC100"
+    assert train1.get_name() == "InterCity 100"
+    assert train1.get_max_speed() == 200.0
+
+    train2 = fdc.Train("FR1000", "Frecciarossa", fdc.TrainType.HIGH_SPEED, 300.0, 0.8, 1.0)
+    assert train2.get_max_speed() == 300.0
+    assert train2.get_acceleration() == 0.8
+    assert train2.get_deceleration() == 1.0
+
+    # Travel time calculation (returns time in hours)
+    assert train2.calculate_travel_time(100.0, 250.0) > 0
+    assert train1.calculate_travel_time(100.0, 200.0) > 0
+
+def test_schedule_stops():
+    """Test schedule stop construction from epoch seconds"""
+    stop = fdc.ScheduleStop(MILANO, 3600, 3900, True)
+    assert stop.get_dwell_time().total_seconds() == 300
+
+    schedule = make_schedule("FR1", 1_700_000_000)
+    assert schedule.get_stop_count() == 2
+    assert schedule.get_stops()[1].node_id == FIRENZE
+
+def test_conflict_detection(network):
+    """Test conflict detection"""
+    detector = fdc.ConflictDetector(network)
+
+    # Two trains leaving MILANO a minute apart, one much later
+    base = 1_700_000_000
+    t1 = make_schedule("FR1", base)
+    t2 = make_schedule("FR2", base + 60)
+    t3 = make_schedule("FR3", base + 4 * 3600)
+
+    conflicting = detector.detect_all([t1, t2])
+    clear = detector.detect_all([t1, t3])
+    assert len(conflicting) > 0
+    assert not clear
+
+    report = fdc.ConflictDetector.format_report(conflicting)
+    assert fdc.ConflictDetector.format_report([]) == ""
+    assert report.count("Conflict #") == len(conflicting)
+    first = conflicting[0]
+    assert report.startswith(
+        f"\n  Conflict #1:\n    Type: {first.type}\n"
+        f"    Trains: {first.train1_id} vs {first.train2_id}\n"
+        f"    Location: {first.location}\n"
+        f"    Severity: {first.severity:.2f}\n"
+        f"    Description: {first.description}\n")
+
+    # Batch detection runs the sets in parallel, results in input order
+    results = detector.detect_all_batch([[t1, t2], [t1, t3]] * 4)
+    assert [len(r) for r in results] == [len(conflicting), len(clear)] * 4
+
+def test_ai_resolver(network):
+    """Test AI-based conflict resolution"""
+    # Create default config
+    config = fdc.RailwayAIConfig()
+    assert config.max_delay_minutes == 30
+    assert config.min_headway_seconds == 120
+
+    # Modify config
+    config.delay_weight = 1.5
+    config.platform_change_weight = 0.3
+    assert config.delay_weight == 1.5
+
+    # Create resolver
+    resolver = fdc.RailwayAIResolver(network, config)
+
+    # Reconfigure the same resolver
+    config.delay_weight = 2.0
+    resolver.set_config(config)
+    assert resolver.get_config().delay_weight == 2.0
+
+    # Resolve two trains leaving MILANO a minute apart
+    base = 1_700_000_000
+    schedules = [make_schedule("FR1", base), make_schedule("FR2", base + 60)]
+    conflicts = fdc.ConflictDetector(network).detect_all(schedules)
+    result = resolver.resolve_conflicts(schedules=schedules, conflicts=conflicts)
+    assert isinstance(result, fdc.ResolutionResult)
+    assert set(result.modified_trains) <= {"FR1", "FR2"}
+
+def test_railml():
+    """Test RailML import/export functionality"""
+    # Version enums
+    assert hasattr(fdc, 'RailMLVersion')
+    assert hasattr(fdc.RailMLVersion, 'VERSION_2')
+    assert hasattr(fdc.RailMLVersion, 'VERSION_3')
+    assert hasattr(fdc, 'RailMLExportVersion')
+
+    # Export options
+    options = fdc.RailMLExportOptions()
+    assert hasattr(options, 'pretty_print')
+
+    assert hasattr(fdc, 'RailMLExporter')
+    assert hasattr(fdc, 'RailMLParser')
+
+def test_railml_export_to_fd(network, tmp_path):
+    """Test streaming RailML export matches the string export"""
+    exporter = fdc.RailMLExporter()
+    options = fdc.RailMLExportOptions()
+    options.include_metadata = False
+    schedules = [make_schedule("FR1", 1_700_000_000)]
+    version = fdc.RailMLExportVersion.VERSION_3
+
+    expected = exporter.export_to_string(network, schedules, version, options)
+
+    path = tmp_path / "network.railml"
+    with open(path, "wb") as f:
+        assert exporter.export_to_fd(f.fileno(), network, schedules, version, options)
+    assert path.read_text(encoding="utf-8") == expected
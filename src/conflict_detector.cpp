@@ -1,6 +1,10 @@
 #include "fdc_scheduler/conflict_detector.hpp"
 #include <algorithm>
+#include <atomic>
 #include <cmath>
+#include <future>
+#include <sstream>
+#include <thread>
 
 namespace fdc_scheduler {
 
@@ -57,6 +61,38 @@ std::vector<Conflict> ConflictDetector::detect_all(
     return all_conflicts;
 }
 
+std::vector<std::vector<Conflict>> ConflictDetector::detect_all_batch(
+    const std::vector<std::vector<std::shared_ptr<TrainSchedule>>>& schedule_sets,
+    size_t max_threads) {
+    
+    std::vector<std::vector<Conflict>> results(schedule_sets.size());
+    if (schedule_sets.empty()) {
+        return results;
+    }
+    
+    size_t num_threads = max_threads > 0 ? max_threads : std::thread::hardware_concurrency();
+    num_threads = std::max<size_t>(1, std::min(num_threads, schedule_sets.size()));
+    
+    // Workers pull the next unprocessed set; each writes only its own result slot
+    std::atomic<size_t> next{0};
+    auto worker = [&]() {
+        for (size_t i = next++; i < schedule_sets.size(); i = next++) {
+            results[i] = detect_all(schedule_sets[i]);
+        }
+    };
+    
+    std::vector<std::future<void>> workers;
+    for (size_t t = 1; t < num_threads; ++t) {
+        workers.push_back(std::async(std::launch::async, worker));
+    }
+    worker();
+    for (auto& w : workers) {
+        w.get();  // Propagates worker exceptions
+    }
+    
+    return results;
+}
+
 std::vector<Conflict> ConflictDetector::detect_for_train(
     const std::shared_ptr<TrainSchedule>& train,
     const std::vector<std::shared_ptr<TrainSchedule>>& all_schedules) {
@@ -5,9 +5,78 @@
 #include <iostream>
 #include <iomanip>
 #include <chrono>
+#include <cerrno>
+#include <cstring>
+
+#ifdef _WIN32
+#include <io.h>
+#else
+#include <unistd.h>
+#endif
 
 namespace fdc_scheduler {
 
+namespace {
+
+/**
+ * @brief pugixml writer that streams to a file descriptor through a 64 KB buffer
+ */
+class FdWriter : public pugi::xml_writer {
+public:
+    static constexpr size_t kBufferSize = 64 * 1024;
+    
+    explicit FdWriter(int fd) : fd_(fd) {
+        buffer_.reserve(kBufferSize);
+    }
+    
+    void write(const void* data, size_t size) override {
+        const char* bytes = static_cast<const char*>(data);
+        if (buffer_.size() + size > kBufferSize) {
+            flush();
+        }
+        if (size >= kBufferSize) {
+            write_all(bytes, size);
+        } else {
+            buffer_.insert(buffer_.end(), bytes, bytes + size);
+        }
+    }
+    
+    bool flush() {
+        if (!buffer_.empty()) {
+            write_all(buffer_.data(), buffer_.size());
+            buffer_.clear();
+        }
+        return error_ == 0;
+    }
+    
+    int error() const { return error_; }
+    
+private:
+    int fd_;
+    int error_ = 0;
+    std::vector<char> buffer_;
+    
+    void write_all(const char* data, size_t size) {
+        while (size > 0 && error_ == 0) {
+#ifdef _WIN32
+            auto written = ::_write(fd_, data, static_cast<unsigned int>(size));
+#else
+            auto written = ::write(fd_, data, size);
+#endif
+            if (written < 0) {
+                if (errno != EINTR) {
+                    error_ = errno;
+                }
+                continue;
+            }
+            data += written;
+            size -= static_cast<size_t>(written);
+        }
+    }
+};
+
+} // namespace
+
 RailMLExporter::RailMLExporter() = default;
 RailMLExporter::~RailMLExporter() = default;
 
@@ -37,18 +106,15 @@ bool RailMLExporter::export_to_file(
     RailMLExportVersion version,
     const RailMLExportOptions& options) {
     
-    std::string xml = export_to_string(network, schedules, version, options);
-    if (xml.empty()) {
-        return false;
-    }
-    
     std::ofstream file(filename);
     if (!file.is_open()) {
         set_error("Cannot create file: " + filename);
         return false;
     }
     
-    file << xml;
+    pugi::xml_document doc;
+    build_document(doc, network, schedules, version, options);
+    doc.save(file, options.pretty_print ? "  " : "");
     return true;
 }
 
@@ -58,13 +124,48 @@ std::string RailMLExporter::export_to_string(
     RailMLExportVersion version,
     const RailMLExportOptions& options) {
     
+    pugi::xml_document doc;
+    build_document(doc, network, schedules, version, options);
+    
+    std::ostringstream oss;
+    doc.save(oss, options.pretty_print ? "  " : "");
+    return oss.str();
+}
+
+bool RailMLExporter::export_to_fd(
+    int fd,
+    const RailwayNetwork& network,
+    const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
+    RailMLExportVersion version,
+    const RailMLExportOptions& options) {
+    
+    pugi::xml_document doc;
+    build_document(doc, network, schedules, version, options);
+    
+    FdWriter writer(fd);
+    doc.save(writer, options.pretty_print ? "  " : "");
+    if (!writer.flush()) {
+        set_error("Write to file descriptor " + std::to_string(fd) + " failed: " +
+                  std::strerror(writer.error()));
+        return false;
+    }
+    return true;
+}
+
+void RailMLExporter::build_document(
+    pugi::xml_document& doc,
+    const RailwayNetwork& network,
+    const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
+    RailMLExportVersion version,
+    const RailMLExportOptions& options) {
+    
     clear_statistics();
     last_error_.clear();
     
     if (version == RailMLExportVersion::VERSION_2) {
-        return export_railml2(network, schedules, options);
+        export_railml2(doc, network, schedules, options);
     } else {
-        return export_railml3(network, schedules, options);
+        export_railml3(doc, network, schedules, options);
     }
 }
 
@@ -87,13 +188,12 @@ std::string RailMLExporter::format_xml(const std::string& xml, bool pretty_print
 // RailML 2.x Export
 //==============================================================================
 
-std::string RailMLExporter::export_railml2(
+void RailMLExporter::export_railml2(
+    pugi::xml_document& doc,
     const RailwayNetwork& network,
     const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
     const RailMLExportOptions& options) {
     
-    pugi::xml_document doc;
-    
     // XML declaration
     auto declaration = doc.prepend_child(pugi::node_declaration);
     declaration.append_attribute("version") = "1.0";
@@ -138,11 +238,6 @@ std::string RailMLExporter::export_railml2(
             }
         }
     }
-    
-    // Convert to string
-    std::ostringstream oss;
-    doc.save(oss, options.pretty_print ? "  " : "");
-    return oss.str();
 }
 
 std::string RailMLExporter::export_railml2_infrastructure(
@@ -267,13 +362,12 @@ std::string RailMLExporter::export_railml2_timetable(
 // RailML 3.x Export
 //==============================================================================
 
-std::string RailMLExporter::export_railml3(
+void RailMLExporter::export_railml3(
+    pugi::xml_document& doc,
     const RailwayNetwork& network,
     const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
     const RailMLExportOptions& options) {
     
-    pugi::xml_document doc;
-    
     // XML declaration
     auto declaration = doc.prepend_child(pugi::node_declaration);
     declaration.append_attribute("version") = "1.0";
@@ -318,11 +412,6 @@ std::string RailMLExporter::export_railml3(
             }
         }
     }
-    
-    // Convert to string
-    std::ostringstream oss;
-    doc.save(oss, options.pretty_print ? "  " : "");
-    return oss.str();
 }
 
 std::string RailMLExporter::export_railml3_infrastructure(
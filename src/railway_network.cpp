@@ -24,6 +24,16 @@ bool RailwayNetwork::add_node(const Node& node) {
     return true;
 }
 
+size_t RailwayNetwork::add_nodes(const std::vector<Node>& nodes) {
+    size_t added = 0;
+    for (const auto& node : nodes) {
+        if (add_node(node)) {
+            ++added;
+        }
+    }
+    return added;
+}
+
 bool RailwayNetwork::remove_node(const std::string& node_id) {
     auto vertex_opt = get_vertex(node_id);
     if (!vertex_opt) {
@@ -118,6 +128,25 @@ bool RailwayNetwork::add_edge(const Edge& edge) {
     return result.second;
 }
 
+size_t RailwayNetwork::add_edges(const std::vector<Edge>& edges,
+                                 std::optional<bool> bidirectional) {
+    size_t added = 0;
+    for (const Edge& edge : edges) {
+        bool ok;
+        if (bidirectional && *bidirectional != edge.is_bidirectional()) {
+            Edge copy = edge;
+            copy.set_bidirectional(*bidirectional);
+            ok = add_edge(copy);
+        } else {
+            ok = add_edge(edge);
+        }
+        if (ok) {
+            ++added;
+        }
+    }
+    return added;
+}
+
 bool RailwayNetwork::remove_edge(const std::string& from_node, const std::string& to_node) {
     auto from_vertex_opt = get_vertex(from_node);
     auto to_vertex_opt = get_vertex(to_node);
@@ -139,6 +139,11 @@ void TrainSchedule::add_stop(const ScheduleStop& stop) {
     stops_.push_back(stop);
 }
 
+void TrainSchedule::add_stops(const std::vector<ScheduleStop>& stops) {
+    stops_.reserve(stops_.size() + stops.size());
+    stops_.insert(stops_.end(), stops.begin(), stops.end());
+}
+
 void TrainSchedule::insert_stop(size_t index, const ScheduleStop& stop) {
     if (index > stops_.size()) {
         throw std::out_of_range("TrainSchedule: insert index out of range");
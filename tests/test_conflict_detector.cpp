@@ -18,3 +18,43 @@ TEST(ConflictDetectorTest, Construction) {
     EXPECT_EQ(network.num_nodes(), 2);
     EXPECT_EQ(network.num_edges(), 1);
 }
+
+// Test parallel detection over independent schedule sets
+TEST(ConflictDetectorTest, DetectAllBatch) {
+    RailwayNetwork network;
+    network.add_node(Node("A", "Node A", NodeType::STATION));
+    network.add_node(Node("B", "Node B", NodeType::STATION));
+    network.add_edge(Edge("A", "B", 100.0));
+    
+    auto t0 = std::chrono::system_clock::now();
+    auto make_schedule = [&](const std::string& id, int offset_min) {
+        auto schedule = std::make_shared<TrainSchedule>(id);
+        auto start = t0 + std::chrono::minutes(offset_min);
+        schedule->add_stop(ScheduleStop("A", start, start + std::chrono::minutes(2)));
+        schedule->add_stop(ScheduleStop("B", start + std::chrono::minutes(40),
+                                        start + std::chrono::minutes(42)));
+        return schedule;
+    };
+    auto t1 = make_schedule("T1", 0);
+    auto t2 = make_schedule("T2", 1);
+    auto t3 = make_schedule("T3", 180);
+    
+    std::vector<std::vector<std::shared_ptr<TrainSchedule>>> sets;
+    for (int i = 0; i < 8; ++i) {
+        sets.push_back({t1, t2});
+        sets.push_back({t1, t3});
+    }
+    
+    ConflictDetector detector(network);
+    auto expected_conflicting = detector.detect_all({t1, t2}).size();
+    auto expected_clear = detector.detect_all({t1, t3}).size();
+    
+    auto results = detector.detect_all_batch(sets, 4);
+    ASSERT_EQ(results.size(), sets.size());
+    for (size_t i = 0; i < results.size(); ++i) {
+        EXPECT_EQ(results[i].size(), i % 2 == 0 ? expected_conflicting : expected_clear);
+    }
+    EXPECT_GT(expected_conflicting, 0u);
+    
+    EXPECT_TRUE(detector.detect_all_batch({}).empty());
+}
@@ -0,0 +1,218 @@
+/**
+ * @file test_railml_exporter.cpp
+ * @brief Unit tests for RailMLExporter output paths (string, file, fd)
+ */
+
+#include <fdc_scheduler/railml_exporter.hpp>
+#include <fdc_scheduler/railway_network.hpp>
+#include <fdc_scheduler/schedule.hpp>
+#include <gtest/gtest.h>
+#include <cstdio>
+#include <fstream>
+#include <sstream>
+#include <thread>
+
+#ifdef _WIN32
+#include <io.h>
+#else
+#include <unistd.h>
+#endif
+#include <fcntl.h>
+
+using namespace fdc_scheduler;
+
+namespace {
+
+constexpr size_t kFdBufferSize = 64 * 1024;  // FdWriter buffer size
+
+// Chain of num_stations stations with one train running end to end
+void build_line(size_t num_stations,
+                RailwayNetwork& network,
+                std::vector<std::shared_ptr<TrainSchedule>>& schedules) {
+    auto schedule = std::make_shared<TrainSchedule>("IC100");
+    auto t = std::chrono::system_clock::time_point(std::chrono::seconds(1700000000));
+
+    for (size_t i = 0; i < num_stations; ++i) {
+        std::string id = "S" + std::to_string(i);
+        network.add_node(Node(id, "Station " + std::to_string(i), NodeType::STATION));
+        if (i > 0) {
+            network.add_edge(Edge("S" + std::to_string(i - 1), id, 10.0, TrackType::DOUBLE));
+        }
+        schedule->add_stop(ScheduleStop(id, t, t + std::chrono::minutes(1), true));
+        t += std::chrono::minutes(10);
+    }
+    schedules.push_back(schedule);
+}
+
+RailMLExportOptions test_options() {
+    RailMLExportOptions options;
+    options.include_metadata = false;  // No timestamps: output is deterministic
+    return options;
+}
+
+std::string read_file(const std::string& path) {
+    std::ifstream in(path, std::ios::binary);
+    std::ostringstream oss;
+    oss << in.rdbuf();
+    return oss.str();
+}
+
+#ifdef _WIN32
+int open_for_write(const std::string& path) {
+    return ::_open(path.c_str(), _O_WRONLY | _O_CREAT | _O_TRUNC | _O_BINARY, 0644);
+}
+int close_fd(int fd) { return ::_close(fd); }
+#else
+int open_for_write(const std::string& path) {
+    return ::open(path.c_str(), O_WRONLY | O_CREAT | O_TRUNC, 0644);
+}
+int close_fd(int fd) { return ::close(fd); }
+#endif
+
+// Export through export_to_fd into a temporary file and read it back
+std::string export_via_fd(RailMLExporter& exporter,
+                          const RailwayNetwork& network,
+                          const std::vector<std::shared_ptr<TrainSchedule>>& schedules,
+                          RailMLExportVersion version) {
+    std::string path = ::testing::TempDir() + "railml_fd_export.xml";
+    int fd = open_for_write(path);
+    EXPECT_GE(fd, 0);
+    EXPECT_TRUE(exporter.export_to_fd(fd, network, schedules, version, test_options()));
+    close_fd(fd);
+    std::string content = read_file(path);
+    std::remove(path.c_str());
+    return content;
+}
+
+} // namespace
+
+TEST(RailMLExporterTest, ExportToString) {
+    RailwayNetwork network;
+    std::vector<std::shared_ptr<TrainSchedule>> schedules;
+    build_line(3, network, schedules);
+
+    RailMLExporter exporter;
+    for (auto version : {RailMLExportVersion::VERSION_2, RailMLExportVersion::VERSION_3}) {
+        std::string xml = exporter.export_to_string(network, schedules, version, test_options());
+
+        EXPECT_EQ(xml.rfind("<?xml", 0), 0u);
+        EXPECT_NE(xml.find("S2"), std::string::npos);
+        EXPECT_TRUE(exporter.get_last_error().empty());
+        EXPECT_EQ(exporter.get_statistics().at("stations"), 3);
+        EXPECT_EQ(exporter.get_statistics().at("trains"), 1);
+    }
+}
+
+TEST(RailMLExporterTest, ExportToFileMatchesString) {
+    RailwayNetwork network;
+    std::vector<std::shared_ptr<TrainSchedule>> schedules;
+    build_line(5, network, schedules);
+
+    RailMLExporter exporter;
+    std::string path = ::testing::TempDir() + "railml_file_export.xml";
+    for (auto version : {RailMLExportVersion::VERSION_2, RailMLExportVersion::VERSION_3}) {
+        std::string expected = exporter.export_to_string(network, schedules, version, test_options());
+
+        ASSERT_TRUE(exporter.export_to_file(path, network, schedules, version, test_options()));
+        EXPECT_EQ(read_file(path), expected);
+    }
+    std::remove(path.c_str());
+
+    EXPECT_FALSE(exporter.export_to_file(::testing::TempDir() + "missing/dir/out.xml",
+                                         network, schedules,
+                                         RailMLExportVersion::VERSION_3, test_options()));
+    EXPECT_NE(exporter.get_last_error().find("Cannot create file"), std::string::npos);
+}
+
+TEST(RailMLExporterTest, ExportToFdMatchesString) {
+    RailwayNetwork network;
+    std::vector<std::shared_ptr<TrainSchedule>> schedules;
+    build_line(5, network, schedules);
+
+    RailMLExporter exporter;
+    for (auto version : {RailMLExportVersion::VERSION_2, RailMLExportVersion::VERSION_3}) {
+        std::string expected = exporter.export_to_string(network, schedules, version, test_options());
+        EXPECT_EQ(export_via_fd(exporter, network, schedules, version), expected);
+        EXPECT_TRUE(exporter.get_last_error().empty());
+    }
+}
+
+TEST(RailMLExporterTest, ExportToFdAcrossBufferBoundary) {
+    // Grow the network one station at a time until the output has crossed
+    // the writer buffer size, checking every size in between
+    RailMLExporter exporter;
+    auto version = RailMLExportVersion::VERSION_3;
+    size_t below = 0, above = 0;
+
+    for (size_t n = 1; above < 3; ++n) {
+        RailwayNetwork network;
+        std::vector<std::shared_ptr<TrainSchedule>> schedules;
+        build_line(n, network, schedules);
+
+        std::string expected = exporter.export_to_string(network, schedules, version, test_options());
+        if (expected.size() + 4096 < kFdBufferSize) {
+            continue;  // Far below the boundary
+        }
+        (expected.size() <= kFdBufferSize ? below : above)++;
+        ASSERT_EQ(export_via_fd(exporter, network, schedules, version), expected)
+            << "output size " << expected.size();
+    }
+    EXPECT_GT(below, 0u);
+
+    // Several buffers' worth
+    RailwayNetwork network;
+    std::vector<std::shared_ptr<TrainSchedule>> schedules;
+    build_line(2000, network, schedules);
+    std::string expected = exporter.export_to_string(network, schedules, version, test_options());
+    ASSERT_GT(expected.size(), 4 * kFdBufferSize);
+    EXPECT_EQ(export_via_fd(exporter, network, schedules, version), expected);
+}
+
+#ifndef _WIN32
+TEST(RailMLExporterTest, ExportToFdPipe) {
+    RailwayNetwork network;
+    std::vector<std::shared_ptr<TrainSchedule>> schedules;
+    build_line(500, network, schedules);
+
+    RailMLExporter exporter;
+    auto version = RailMLExportVersion::VERSION_3;
+    std::string expected = exporter.export_to_string(network, schedules, version, test_options());
+    ASSERT_GT(expected.size(), kFdBufferSize);
+
+    int fds[2];
+    ASSERT_EQ(::pipe(fds), 0);
+
+    // Drain the read end concurrently; the output is larger than the pipe buffer
+    std::string received;
+    std::thread reader([&] {
+        char chunk[4096];
+        ssize_t n;
+        while ((n = ::read(fds[0], chunk, sizeof(chunk))) > 0) {
+            received.append(chunk, static_cast<size_t>(n));
+        }
+    });
+
+    bool ok = exporter.export_to_fd(fds[1], network, schedules, version, test_options());
+    ::close(fds[1]);
+    reader.join();
+    ::close(fds[0]);
+
+    EXPECT_TRUE(ok);
+    EXPECT_EQ(received, expected);
+}
+#endif
+
+TEST(RailMLExporterTest, ExportToBadFdFails) {
+    RailwayNetwork network;
+    std::vector<std::shared_ptr<TrainSchedule>> schedules;
+    build_line(3, network, schedules);
+
+    RailMLExporter exporter;
+    EXPECT_FALSE(exporter.export_to_fd(-1, network, schedules,
+                                       RailMLExportVersion::VERSION_3, test_options()));
+    EXPECT_NE(exporter.get_last_error().find("file descriptor -1"), std::string::npos);
+
+    // A later successful export clears the error
+    exporter.export_to_string(network, schedules, RailMLExportVersion::VERSION_3, test_options());
+    EXPECT_TRUE(exporter.get_last_error().empty());
+}
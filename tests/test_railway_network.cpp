@@ -62,6 +62,48 @@ TEST(RailwayNetworkTest, Clear) {
     EXPECT_EQ(network.num_nodes(), 0);
 }
 
+TEST(RailwayNetworkTest, AddNodesAndEdgesBulk) {
+    RailwayNetwork network;
+    
+    size_t nodes_added = network.add_nodes({
+        Node("A", "Node A", NodeType::STATION),
+        Node("B", "Node B", NodeType::STATION),
+        Node("C", "Node C", NodeType::STATION),
+        Node("A", "Duplicate A", NodeType::STATION)
+    });
+    EXPECT_EQ(nodes_added, 3);
+    EXPECT_EQ(network.num_nodes(), 3);
+    
+    size_t edges_added = network.add_edges({
+        Edge("A", "B", 100.0),
+        Edge("B", "C", 50.0),
+        Edge("C", "X", 10.0)  // Unknown endpoint
+    });
+    EXPECT_EQ(edges_added, 2);
+    EXPECT_TRUE(network.has_edge("B", "A"));
+    EXPECT_TRUE(network.has_edge("C", "B"));
+    
+    RailwayNetwork oneway;
+    oneway.add_nodes({Node("A", "Node A"), Node("B", "Node B")});
+    EXPECT_EQ(oneway.add_edges({Edge("A", "B", 100.0)}, false), 1);
+    EXPECT_TRUE(oneway.has_edge("A", "B"));
+    EXPECT_FALSE(oneway.has_edge("B", "A"));
+    
+    // Without an override each edge keeps its own flag
+    RailwayNetwork mixed;
+    mixed.add_nodes({Node("A", "Node A"), Node("B", "Node B"), Node("C", "Node C")});
+    Edge one_way("A", "B", 100.0, TrackType::SINGLE, 120.0, 1, false);
+    EXPECT_EQ(mixed.add_edges({one_way, Edge("B", "C", 50.0)}), 2);
+    EXPECT_FALSE(mixed.has_edge("B", "A"));
+    EXPECT_TRUE(mixed.has_edge("C", "B"));
+    
+    // An explicit true overrides a one-way edge
+    RailwayNetwork forced;
+    forced.add_nodes({Node("A", "Node A"), Node("B", "Node B")});
+    EXPECT_EQ(forced.add_edges({one_way}, true), 1);
+    EXPECT_TRUE(forced.has_edge("B", "A"));
+}
+
 int main(int argc, char** argv) {
     testing::InitGoogleTest(&argc, argv);
     return RUN_ALL_TESTS();
@@ -24,3 +24,21 @@ TEST(TrainScheduleTest, AddStop) {
     schedule.add_stop(stop);
     EXPECT_EQ(schedule.get_stop_count(), 1);
 }
+
+// Test bulk insertion of stops
+TEST(TrainScheduleTest, AddStops) {
+    TrainSchedule schedule("T1");
+    auto t0 = std::chrono::system_clock::now();
+    
+    schedule.add_stop(ScheduleStop("A", t0, t0 + std::chrono::minutes(5)));
+    schedule.add_stops({
+        ScheduleStop("B", t0 + std::chrono::minutes(30), t0 + std::chrono::minutes(33)),
+        ScheduleStop("C", t0 + std::chrono::minutes(60), t0 + std::chrono::minutes(60), false)
+    });
+    
+    ASSERT_EQ(schedule.get_stop_count(), 3);
+    EXPECT_EQ(schedule.get_stop(0).node_id, "A");
+    EXPECT_EQ(schedule.get_stop(1).node_id, "B");
+    EXPECT_EQ(schedule.get_stop(2).node_id, "C");
+    EXPECT_FALSE(schedule.get_stop(2).is_stop);
+}